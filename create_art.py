@@ -6,15 +6,20 @@ A dreamy cluster of floating orbs with dramatic lighting
 import bpy
 import random
 import math
+import os
+import sys
 
-# Clear the scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_utils import configure_cycles, purge_scene
 
-# Remove default light and camera
-for obj in bpy.data.objects:
-    if obj.type in ('LIGHT', 'CAMERA'):
-        bpy.data.objects.remove(obj, do_unlink=True)
+# Light and camera angles
+DEG30 = math.radians(30)
+DEG45 = math.radians(45)
+DEG60 = math.radians(60)
+DEG80 = math.radians(80)
+DEG180 = math.radians(180)
+
+purge_scene()
 
 # Create a metaball cluster (organic blobby shapes)
 bpy.ops.object.metaball_add(type='BALL', radius=1.0, location=(0, 0, 0))
@@ -22,7 +27,8 @@ meta_obj = bpy.context.active_object
 meta_obj.name = "BlobCluster"
 
 meta_data = meta_obj.data
-meta_data.resolution = 0.3  # Lower = smoother
+meta_data.resolution = 0.6  # Viewport: coarse, cheap to re-polygonize
+meta_data.render_resolution = 0.3  # Render: lower = smoother
 
 # Add multiple metaball elements
 positions = [
@@ -71,7 +77,7 @@ bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
 key_light = bpy.context.active_object
 key_light.data.energy = 5.0
 key_light.data.color = (1.0, 0.95, 0.8)
-key_light.rotation_euler = (math.radians(45), 0, math.radians(30))
+key_light.rotation_euler = (DEG45, 0, DEG30)
 
 # Fill light (cool)
 bpy.ops.object.light_add(type='AREA', location=(-5, -3, 5))
@@ -85,8 +91,8 @@ bpy.ops.object.light_add(type='SPOT', location=(0, -8, 2))
 rim_light = bpy.context.active_object
 rim_light.data.energy = 10.0
 rim_light.data.color = (0.8, 0.3, 0.9)
-rim_light.data.spot_size = math.radians(30)
-rim_light.rotation_euler = (math.radians(80), 0, math.radians(180))
+rim_light.data.spot_size = DEG30
+rim_light.rotation_euler = (DEG80, 0, DEG180)
 
 # Add ground plane for shadows
 bpy.ops.mesh.primitive_plane_add(size=20, location=(0, 0, -2))
@@ -106,7 +112,7 @@ ground.data.materials.append(ground_mat)
 # Position camera
 bpy.ops.object.camera_add(location=(6, -6, 4))
 camera = bpy.context.active_object
-camera.rotation_euler = (math.radians(60), 0, math.radians(45))
+camera.rotation_euler = (DEG60, 0, DEG45)
 
 # Point camera at the center
 bpy.ops.object.select_all(action='DESELECT')
@@ -118,9 +124,7 @@ camera.constraints['Track To'].target = meta_obj
 # Set render settings
 scene = bpy.context.scene
 scene.camera = camera
-scene.render.engine = 'CYCLES'
-scene.cycles.device = 'CPU'
-scene.cycles.samples = 64  # Low for faster render
+configure_cycles(scene, samples=64)  # Low for faster render
 scene.render.resolution_x = 800
 scene.render.resolution_y = 600
 scene.render.resolution_percentage = 100
@@ -8,35 +8,75 @@ Shape Grammar Rules:
 4. RHYTHM: Column/pilaster spacing follows harmonic progression
 """
 import bpy
+import bmesh
 import math
-from mathutils import Vector
+import os
+import sys
+from mathutils import Matrix, Vector
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_utils import (configure_cycles, cube_template, cylinder_template,
+                         link_shape, principled_template, purge_scene)
+
+# Rotation angles
+DEG30 = math.radians(30)
+DEG45 = math.radians(45)
+DEG50 = math.radians(50)
+DEG80 = math.radians(80)
+DEG90 = math.radians(90)
+DEG180 = math.radians(180)
+
+purge_scene()
 
 # === SHAPE GRAMMAR DEFINITIONS ===
+# Shapes are objects sharing template meshes, built through bpy.data rather
+# than bpy.ops so no scene update runs per shape. Template meshes carry one
+# empty material slot; the material is linked per object.
+PRISM_FACES = [
+    (0, 3, 2, 1),  # base
+    (0, 1, 5, 4), (2, 3, 4, 5),  # front and back slopes
+    (1, 2, 5), (3, 0, 4),  # end gables/hips
+]
 
-def create_cube(name, size, location, rotation=(0,0,0)):
+prism_templates = {}
+
+def prism_template(ridge):
+    """Unit prism with a ridge along x: ridge=1 is a gable, ridge<1 a hipped roof"""
+    if ridge not in prism_templates:
+        mesh = bpy.data.meshes.new(f"PrismTemplate_{len(prism_templates)}")
+        bm = bmesh.new()
+        corners = [(-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5),
+                   (-ridge/2, 0, 0.5), (ridge/2, 0, 0.5)]
+        verts = [bm.verts.new(co) for co in corners]
+        for face in PRISM_FACES:
+            bm.faces.new([verts[i] for i in face])
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.materials.append(None)
+        prism_templates[ridge] = mesh
+    return prism_templates[ridge]
+
+def create_cube(name, size, location, rotation=(0,0,0), material=None):
     """Basic shape: Cube"""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location, rotation=rotation)
-    obj = bpy.context.active_object
-    obj.name = name
+    obj = link_shape(name, cube_template(), location, rotation, material)
     obj.scale = size
     return obj
 
-def create_cylinder(name, radius, depth, location, rotation=(0,0,0), vertices=16):
+def create_cylinder(name, radius, depth, location, rotation=(0,0,0), vertices=16, material=None):
     """Basic shape: Cylinder (for columns)"""
-    bpy.ops.mesh.primitive_cylinder_add(radius=radius, depth=depth, vertices=vertices, location=location, rotation=rotation)
-    obj = bpy.context.active_object
-    obj.name = name
+    return link_shape(name, cylinder_template(radius, depth, vertices), location, rotation, material)
+
+def create_prism(name, size, location, ridge=1.0, rotation=(0,0,0), material=None):
+    """Basic shape: Prism filling the same box as create_cube (pediments, roofs)"""
+    obj = link_shape(name, prism_template(ridge), location, rotation, material)
+    obj.scale = size
     return obj
 
 def mirror_x(obj, offset=0):
     """Rule: Mirror across X axis"""
-    bpy.ops.object.duplicate()
-    mirrored = bpy.context.active_object
+    mirrored = obj.copy()
     mirrored.location.x = -mirrored.location.x + (2 * offset)
+    bpy.context.collection.objects.link(mirrored)
     return mirrored
 
 def create_symmetric_pair(name, location, size, spacing):
@@ -46,10 +86,12 @@ def create_symmetric_pair(name, location, size, spacing):
     return left, right
 
 # === MATERIALS ===
+material_template = principled_template()
+
 def create_material(name, color, roughness=0.5, metallic=0.0):
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    mat = material_template.copy()
+    mat.name = name
+    bsdf = next((n for n in mat.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
     if bsdf:
         bsdf.inputs['Base Color'].default_value = (*color, 1.0)
         bsdf.inputs['Roughness'].default_value = roughness
@@ -82,29 +124,25 @@ VILLA_HEIGHT_ATTIC = MODULE * 1.5
 # === CONSTRUCTION: BASEMENT (RUSTICATED) ===
 print("Building rusticated base...")
 base = create_cube("Base", (VILLA_WIDTH/2, VILLA_DEPTH/2, VILLA_HEIGHT_BASE/2), 
-                   (center_x, center_y, VILLA_HEIGHT_BASE/2))
-base.data.materials.append(stone_rustic)
+                   (center_x, center_y, VILLA_HEIGHT_BASE/2), material=stone_rustic)
 
 # Add rustication texture via displacement (simplified as bands)
 for i in range(5):
     z = (i + 0.5) * (VILLA_HEIGHT_BASE / 5)
     band = create_cube(f"RusticBand_{i}", (VILLA_WIDTH/2 + 0.1, VILLA_DEPTH/2 + 0.1, 0.05),
-                       (center_x, center_y, z))
-    band.data.materials.append(stone_rustic)
+                       (center_x, center_y, z), material=stone_rustic)
 
 # === CONSTRUCTION: PIANO NOBILE (MAIN FLOOR) ===
 print("Building piano nobile...")
 piano_y = VILLA_HEIGHT_BASE + VILLA_HEIGHT_PIANO/2
 piano_nobile = create_cube("PianoNobile", (VILLA_WIDTH/2 - 0.2, VILLA_DEPTH/2 - 0.2, VILLA_HEIGHT_PIANO/2),
-                           (center_x, center_y, piano_y))
-piano_nobile.data.materials.append(stucco_refined)
+                           (center_x, center_y, piano_y), material=stucco_refined)
 
 # === CONSTRUCTION: ATTIC ===
 print("Building attic...")
 attic_y = VILLA_HEIGHT_BASE + VILLA_HEIGHT_PIANO + VILLA_HEIGHT_ATTIC/2
 attic = create_cube("Attic", (VILLA_WIDTH/2 - 0.4, VILLA_DEPTH/2 - 0.4, VILLA_HEIGHT_ATTIC/2),
-                    (center_x, center_y, attic_y))
-attic.data.materials.append(stucco_refined)
+                    (center_x, center_y, attic_y), material=stucco_refined)
 
 # === CONSTRUCTION: PEDIMENT (CENTRAL) ===
 print("Building central pediment...")
@@ -113,10 +151,10 @@ pediment_height = MODULE * 2
 pediment_depth = VILLA_DEPTH * 0.3
 pediment_y = VILLA_HEIGHT_BASE + VILLA_HEIGHT_PIANO + VILLA_HEIGHT_ATTIC + pediment_height/2
 
-# Triangular pediment using a prism (simplified as scaled cube for now)
-pediment = create_cube("Pediment", (pediment_width/2, pediment_depth/2, pediment_height/2),
-                       (center_x, center_y, pediment_y))
-pediment.data.materials.append(stucco_refined)
+# Triangular pediment: gable prism with its ridge running front to back
+pediment = create_prism("Pediment", (pediment_depth/2, pediment_width/2, pediment_height/2),
+                        (center_x, center_y, pediment_y), rotation=(0, 0, DEG90),
+                        material=stucco_refined)
 
 # === COLUMNS / PILASTERS (TUSCAN ORDER - SIMPLIFIED) ===
 print("Building column order...")
@@ -130,13 +168,11 @@ for i in range(3):
     x_offset = (i - 1) * COL_SPACING * 2
     # Front row
     col_front = create_cylinder(f"Column_F_{i}", COL_RADIUS, COL_HEIGHT,
-                                (center_x + x_offset, portico_depth, VILLA_HEIGHT_BASE + COL_HEIGHT/2))
-    col_front.data.materials.append(marble)
+                                (center_x + x_offset, portico_depth, VILLA_HEIGHT_BASE + COL_HEIGHT/2), material=marble)
     # Mirror for symmetry if not center
     if x_offset != 0:
         col_front_mirrored = create_cylinder(f"Column_F_{i}_mir", COL_RADIUS, COL_HEIGHT,
-                                             (center_x - x_offset, portico_depth, VILLA_HEIGHT_BASE + COL_HEIGHT/2))
-        col_front_mirrored.data.materials.append(marble)
+                                             (center_x - x_offset, portico_depth, VILLA_HEIGHT_BASE + COL_HEIGHT/2), material=marble)
 
 # === WINDOWS (RHYTHMIC GRID) ===
 print("Placing windows...")
@@ -151,53 +187,58 @@ win_positions = [
     (0, MODULE * 3), (0, MODULE * 4)
 ]
 
-for x, y in win_positions:
-    if x != 0:  # Skip center on front (that's the door/portico)
-        win = create_cube(f"Window_{x}_{y}", (WIN_WIDTH/2, WIN_DEPTH, WIN_HEIGHT/2),
-                          (center_x + x, y if y != 0 else VILLA_DEPTH/2 - 0.3, win_z))
-        win.data.materials.append(window_glass)
-        # Mirror
-        if x != 0:
-            win_mir = create_cube(f"Window_mir_{x}_{y}", (WIN_WIDTH/2, WIN_DEPTH, WIN_HEIGHT/2),
-                                  (center_x - x, y if y != 0 else VILLA_DEPTH/2 - 0.3, win_z))
-            win_mir.data.materials.append(window_glass)
+# Both mirror halves with their resolved y, skipping the front center (that's the door/portico)
+win_placements = [
+    (name, center_x + x_signed, VILLA_DEPTH/2 - 0.3 if y == 0 else y)
+    for x, y in win_positions if x != 0
+    for name, x_signed in ((f"Window_{x}_{y}", x), (f"Window_mir_{x}_{y}", -x))
+]
+for name, x, y in win_placements:
+    create_cube(name, (WIN_WIDTH/2, WIN_DEPTH, WIN_HEIGHT/2), (x, y, win_z), material=window_glass)
 
 # === CENTRAL DOME (PALLADIAN FEATURE) ===
 print("Building dome...")
 dome_base = VILLA_HEIGHT_BASE + VILLA_HEIGHT_PIANO + VILLA_HEIGHT_ATTIC + pediment_height
 dome_radius = pediment_width * 0.35
 
+# Drum, dome and cupola are one mesh (one object, one BVH) built around the drum base;
+# the cupola is told apart by its material slot
+dome_bm = bmesh.new()
+
 # Dome base (drum)
-bpy.ops.mesh.primitive_cylinder_add(radius=dome_radius, depth=MODULE, vertices=32,
-                                    location=(center_x, center_y, dome_base + MODULE/2))
-drum = bpy.context.active_object
-drum.name = "DomeDrum"
-drum.data.materials.append(stucco_refined)
-
-# The dome itself (UV sphere, upper half)
-bpy.ops.mesh.primitive_uv_sphere_add(radius=dome_radius, segments=32, ring_count=16,
-                                     location=(center_x, center_y, dome_base + MODULE))
-dome = bpy.context.active_object
-dome.name = "Dome"
-dome.scale.z = 0.6  # Squash to proper dome proportion
-dome.data.materials.append(stucco_refined)
+bmesh.ops.create_cone(dome_bm, cap_ends=True, segments=32, radius1=dome_radius, radius2=dome_radius,
+                      depth=MODULE, matrix=Matrix.Translation((0, 0, MODULE/2)))
+
+# The dome itself (UV sphere), squashed to proper dome proportion; its lower half
+# reaches down below the drum and closes the gap to the roof and pediment
+bmesh.ops.create_uvsphere(dome_bm, u_segments=32, v_segments=16, radius=dome_radius,
+                          matrix=Matrix.Translation((0, 0, MODULE)) @ Matrix.Diagonal((1, 1, 0.6, 1)))
 
 # Cupola on top
-bpy.ops.mesh.primitive_cylinder_add(radius=dome_radius*0.15, depth=MODULE*0.8, vertices=16,
-                                    location=(center_x, center_y, dome_base + MODULE + dome_radius*0.6))
-cupola = bpy.context.active_object
-cupola.name = "Cupola"
-cupola.data.materials.append(marble)
+cupola = bmesh.ops.create_cone(dome_bm, cap_ends=True, segments=16, radius1=dome_radius*0.15,
+                               radius2=dome_radius*0.15, depth=MODULE*0.8,
+                               matrix=Matrix.Translation((0, 0, MODULE + dome_radius*0.6)))
+for face in {f for v in cupola['verts'] for f in v.link_faces}:
+    face.material_index = 1
+
+dome_mesh = bpy.data.meshes.new("DomeAssembly")
+dome_bm.to_mesh(dome_mesh)
+dome_bm.free()
+dome_mesh.materials.append(stucco_refined)
+dome_mesh.materials.append(marble)
+dome = bpy.data.objects.new("DomeAssembly", dome_mesh)
+dome.location = (center_x, center_y, dome_base)
+bpy.context.collection.objects.link(dome)
 
 # === ROOF ===
 print("Building roof...")
 roof_height = MODULE * 1.5
 roof_y = VILLA_HEIGHT_BASE + VILLA_HEIGHT_PIANO + VILLA_HEIGHT_ATTIC
 
-# Main hipped roof (simplified as sloped planes)
-roof = create_cube("Roof", (VILLA_WIDTH/2 + 0.3, VILLA_DEPTH/2 + 0.3, roof_height/2),
-                   (center_x, center_y, roof_y + roof_height/2))
-roof.data.materials.append(roof_tiles)
+# Main hipped roof: equal-pitch hips, so the ridge is shorter than the eaves by the roof depth
+roof_size = (VILLA_WIDTH/2 + 0.3, VILLA_DEPTH/2 + 0.3, roof_height/2)
+roof = create_prism("Roof", roof_size, (center_x, center_y, roof_y + roof_height/2),
+                    ridge=1 - roof_size[1] / roof_size[0], material=roof_tiles)
 
 # === STAIRS ===
 print("Adding stairs...")
@@ -205,15 +246,14 @@ stairs_width = COL_SPACING * 4
 stairs_depth = MODULE * 1.5
 stairs_height = VILLA_HEIGHT_BASE
 stairs_steps = 7
+step_height = stairs_height / stairs_steps
+step_depth = stairs_depth / stairs_steps
 
 for i in range(stairs_steps):
-    step_height = stairs_height / stairs_steps
-    step_depth = stairs_depth / stairs_steps
     y_pos = portico_depth + stairs_depth - (i + 0.5) * step_depth
     z_pos = (i + 0.5) * step_height
     step = create_cube(f"Step_{i}", (stairs_width/2, step_depth/2, step_height/2),
-                       (center_x, y_pos, z_pos))
-    step.data.materials.append(stone_rustic)
+                       (center_x, y_pos, z_pos), material=stone_rustic)
 
 # === LIGHTING ===
 print("Setting up lighting...")
@@ -222,7 +262,7 @@ bpy.ops.object.light_add(type='SUN', location=(20, -20, 30))
 sun = bpy.context.active_object
 sun.data.energy = 5.0
 sun.data.color = (1.0, 0.95, 0.85)
-sun.rotation_euler = (math.radians(50), 0, math.radians(45))
+sun.rotation_euler = (DEG50, 0, DEG45)
 
 # Fill light (cool, opposite side)
 bpy.ops.object.light_add(type='AREA', location=(-15, 10, 15))
@@ -236,15 +276,16 @@ bpy.ops.object.light_add(type='SUN', location=(0, 30, 10))
 rim = bpy.context.active_object
 rim.data.energy = 1.5
 rim.data.color = (0.9, 0.9, 1.0)
-rim.rotation_euler = (math.radians(80), 0, math.radians(180))
+rim.rotation_euler = (DEG80, 0, DEG180)
 
 # === CAMERA ===
 print("Positioning camera...")
 # Three-quarter view, classic architectural perspective
 cam_distance = max(VILLA_WIDTH, VILLA_DEPTH) * 1.8
-cam_angle = math.radians(30)
-bpy.ops.object.camera_add(location=(cam_distance * math.cos(cam_angle), 
-                                     -cam_distance * math.sin(cam_angle), 
+cam_angle = DEG30
+cos_a, sin_a = math.cos(cam_angle), math.sin(cam_angle)
+bpy.ops.object.camera_add(location=(cam_distance * cos_a,
+                                     -cam_distance * sin_a,
                                      VILLA_HEIGHT_BASE + VILLA_HEIGHT_PIANO))
 camera = bpy.context.active_object
 camera.name = "ArchitectCamera"
@@ -258,9 +299,14 @@ camera.rotation_euler = rot_quat.to_euler()
 print("Configuring render...")
 scene = bpy.context.scene
 scene.camera = camera
-scene.render.engine = 'CYCLES'
-scene.cycles.device = 'CPU'
-scene.cycles.samples = 128  # Higher quality for architecture
+configure_cycles(scene, samples=32)  # Low sample count, cleaned up by the denoiser
+scene.cycles.denoiser = 'OPENIMAGEDENOISE'
+scene.cycles.denoising_input_passes = 'RGB_ALBEDO_NORMAL'
+scene.cycles.denoising_prefilter = 'ACCURATE'
+# Opaque stucco and stone: a few bounces carry nearly all of the light
+scene.cycles.max_bounces = 4
+scene.cycles.glossy_bounces = 2
+scene.cycles.transmission_bounces = 2
 scene.render.resolution_x = 1200
 scene.render.resolution_y = 900
 scene.render.resolution_percentage = 100
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Render All
+Runs each scene script as its own background Blender process.
+
+The scripts are independent render jobs, so they run side by side instead of
+one after another. Cycles already spreads a single render over every thread it
+is given, so only a quarter of the cores' worth of jobs run at once and the
+threads are divided between them. Pass --jobs 1 when the scripts render on a
+single GPU; parallel jobs would only queue on the device.
+
+Usage:
+    python3 render_all.py [--blender PATH] [--jobs N] [script ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+
+SCRIPTS = [
+    "create_art.py",
+    "palladian_villa.py",
+    "villa_rotonda.py",
+    "vignelli_study/vignelli_visual_score.py",
+    "vignelli_study/vignelli_visual_score_v2.py",
+    "vignelli_study/vignelli_visual_score_v3.py",
+    "vignelli_study/vignelli_visual_score_v4.py",
+]
+
+def render(blender, script, threads):
+    """Run one script in background Blender; returns (script, exit code, output)"""
+    # --python-exit-code: a script that raises fails the process instead of exiting 0
+    cmd = [blender, "-b", "-t", str(threads), "--python-exit-code", "1", "--python", str(REPO_DIR / script)]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return script, result.returncode, result.stdout
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Render the scene scripts in parallel Blender processes")
+    parser.add_argument("scripts", nargs="*", default=SCRIPTS, help="scripts to render (default: all)")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--jobs", type=int, default=max(1, cpus // 4), help="concurrent Blender processes")
+    args = parser.parse_args()
+
+    threads = max(1, cpus // args.jobs)
+    print(f"🎬 Rendering {len(args.scripts)} scripts, {args.jobs} at a time, {threads} threads each")
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        jobs = [pool.submit(render, args.blender, script, threads) for script in args.scripts]
+        for job in jobs:
+            script, code, output = job.result()
+            if code == 0:
+                print(f"✅ {script}")
+            else:
+                failed.append(script)
+                print(f"❌ {script} (exit {code})\n{output}")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Scene Utils
+Helpers shared by the scene scripts: scene purge, render engine setup,
+template meshes and materials, and the Vignelli block grid.
+
+Each script runs on its own under `blender --python`, so it puts the repo
+directory on sys.path before importing this module.
+"""
+import bpy
+import bmesh
+import numpy as np
+
+# === SCENE ===
+# Template meshes built on first use; cleared with the scene they live in
+shape_templates = {}
+
+def purge_scene():
+    """Remove every object, mesh, material, light, camera, metaball and node group directly (no operator scene scan or undo push)"""
+    for datablocks in (bpy.data.objects, bpy.data.meshes, bpy.data.materials,
+                       bpy.data.lights, bpy.data.cameras, bpy.data.metaballs,
+                       bpy.data.node_groups):
+        for item in list(datablocks):
+            datablocks.remove(item)
+    shape_templates.clear()
+
+# === RENDERING ===
+def configure_cycles(scene, samples):
+    """Cycles on the first available GPU backend (CPU otherwise), adaptively sampled and denoised"""
+    scene.render.engine = 'CYCLES'
+    prefs = bpy.context.preferences.addons['cycles'].preferences
+    prefs.refresh_devices()
+    for backend in ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI'):
+        try:
+            prefs.compute_device_type = backend
+        except TypeError:
+            continue  # Backend not built into this Blender
+        devices = prefs.get_devices_for_type(backend)
+        if any(d.type != 'CPU' for d in devices):
+            for d in devices:
+                d.use = (d.type != 'CPU')
+            scene.cycles.device = 'GPU'
+            # GPUs stay busier on large tiles than on the CPU-sized default
+            scene.cycles.tile_size = 2048
+            break
+    else:
+        prefs.compute_device_type = 'NONE'
+        scene.cycles.device = 'CPU'
+
+    scene.cycles.samples = samples
+    scene.cycles.use_adaptive_sampling = True
+    scene.cycles.adaptive_threshold = 0.01
+    scene.cycles.adaptive_min_samples = max(8, samples // 8)
+    scene.cycles.use_denoising = True
+    scene.cycles.denoiser = 'OPTIX' if prefs.compute_device_type == 'OPTIX' else 'OPENIMAGEDENOISE'
+    # Keep BVH, shaders and textures between renders in the same session
+    scene.render.use_persistent_data = True
+
+def configure_eevee(scene, samples):
+    """EEVEE Next where the build has it (Blender 4.2-4.4), plain EEVEE otherwise"""
+    try:
+        scene.render.engine = 'BLENDER_EEVEE_NEXT'
+    except TypeError:
+        scene.render.engine = 'BLENDER_EEVEE'
+    scene.eevee.taa_render_samples = samples
+    # Legacy EEVEE options; EEVEE Next dropped some of them
+    for option, value in (('use_gtao', True), ('use_bloom', False), ('use_soft_shadows', True)):
+        if hasattr(scene.eevee, option):
+            setattr(scene.eevee, option, value)
+
+# === MATERIALS ===
+def principled_template():
+    """Material with the default Principled BSDF tree, built once and copied per material"""
+    mat = bpy.data.materials.new(name="PrincipledTemplate")
+    mat.use_nodes = True
+    return mat
+
+# === SHAPES ===
+# Shapes are objects sharing template meshes, built through bpy.data rather
+# than bpy.ops so no scene update runs per shape. Template meshes carry one
+# empty material slot; the material is linked per object.
+CUBE_VERTS = [
+    (-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5),
+    (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5),
+]
+CUBE_FACES = [
+    (0, 3, 2, 1), (4, 5, 6, 7),
+    (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+]
+
+def cube_template():
+    """Unit cube mesh, built on first use"""
+    if 'cube' not in shape_templates:
+        mesh = bpy.data.meshes.new("CubeTemplate")
+        mesh.from_pydata(CUBE_VERTS, [], CUBE_FACES)
+        mesh.update()
+        mesh.materials.append(None)
+        shape_templates['cube'] = mesh
+    return shape_templates['cube']
+
+def cylinder_template(radius, depth, vertices):
+    """One capped cylinder mesh per unique (radius, depth, vertices)"""
+    key = ('cylinder', radius, depth, vertices)
+    if key not in shape_templates:
+        mesh = bpy.data.meshes.new(f"CylinderTemplate_{len(shape_templates)}")
+        bm = bmesh.new()
+        bmesh.ops.create_cone(bm, cap_ends=True, segments=vertices,
+                              radius1=radius, radius2=radius, depth=depth)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.materials.append(None)
+        shape_templates[key] = mesh
+    return shape_templates[key]
+
+def link_shape(name, mesh, location, rotation=(0,0,0), material=None):
+    """Instance a template mesh as a new object in the active collection"""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    if material:
+        obj.material_slots[0].link = 'OBJECT'
+        obj.material_slots[0].material = material
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+# === BLOCK GRID ===
+# Unit block standing on z=0: 8 corners and 6 outward-facing quads
+BLOCK_CORNERS = np.array([
+    (-0.5, -0.5, 0), (0.5, -0.5, 0), (0.5, 0.5, 0), (-0.5, 0.5, 0),
+    (-0.5, -0.5, 1), (0.5, -0.5, 1), (0.5, 0.5, 1), (-0.5, 0.5, 1),
+], dtype=np.float32)
+BLOCK_FACES = np.array([
+    (0, 3, 2, 1), (4, 5, 6, 7),  # bottom, top
+    (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),  # sides
+], dtype=np.int32)
+
+def build_block_mesh(name, xs, ys, size, heights):
+    """One mesh with a block per (x, y, height), uploaded through foreach_set buffers"""
+    n = len(heights)
+    scale = np.column_stack((np.full(n, size), np.full(n, size), heights))
+    offset = np.column_stack((xs, ys, np.zeros(n)))
+    verts = BLOCK_CORNERS * scale[:, None, :] + offset[:, None, :]
+    loops = (BLOCK_FACES + len(BLOCK_CORNERS) * np.arange(n, dtype=np.int32)[:, None, None]).ravel()
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(n * len(BLOCK_CORNERS))
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", loops)
+    mesh.polygons.add(n * len(BLOCK_FACES))
+    # All quads: each polygon starts 4 loops after the previous one (loop_total follows)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(loops), 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    return mesh
@@ -1,11 +1,19 @@
 import bpy
-import random
 import math
+import numpy as np
+import os
+import sys
 from mathutils import Vector
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scene_utils import (BLOCK_FACES, build_block_mesh, configure_eevee,
+                         principled_template, purge_scene)
+
+# Light and camera angles
+DEG45 = math.radians(45)
+DEG55 = math.radians(55)
+
+purge_scene()
 
 # VIGNELLI PARAMETERS
 COLS = 12
@@ -15,9 +23,11 @@ GUTTER = 0.1
 VIGNELLI_RED = (0.85, 0.1, 0.05, 1.0)
 BONE_WHITE = (0.95, 0.95, 0.9, 1.0)
 
+material_template = principled_template()
+
 def create_mat(name, color):
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
+    mat = material_template.copy()
+    mat.name = name
     bsdf = mat.node_tree.nodes.get("Principled BSDF")
     bsdf.inputs['Base Color'].default_value = color
     bsdf.inputs['Roughness'].default_value = 0.1 # Sharp, modern
@@ -26,26 +36,33 @@ def create_mat(name, color):
 red_m = create_mat("VignelliRed", VIGNELLI_RED)
 white_m = create_mat("ArchitecturalWhite", BONE_WHITE)
 
-# Generate Grid
-for c in range(COLS):
-    for r in range(ROWS):
-        # The "Logic": Create a varied extrusions based on a grid pattern
-        # Every 3rd row/col is a "dominant" beat
-        is_beat = (c % 3 == 0) or (r % 4 == 0)
-        
-        x = c * (MODULE_SIZE + GUTTER)
-        y = r * (MODULE_SIZE + GUTTER)
-        
-        height = random.uniform(0.1, 0.5)
-        if is_beat:
-            height = random.uniform(2.0, 4.0)
-            
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, height/2))
-        block = bpy.context.active_object
-        block.scale = (MODULE_SIZE, MODULE_SIZE, height)
-        
-        # Color logic: Red for the beats, white for the texture
-        block.data.materials.append(red_m if is_beat and random.random() > 0.3 else white_m)
+# Generate Grid: heights and colors for every cell drawn in one vectorized pass
+rng = np.random.default_rng(42)
+cc, rr = np.meshgrid(np.arange(COLS), np.arange(ROWS), indexing='ij')
+
+# The "Logic": Create a varied extrusions based on a grid pattern
+# Every 3rd row/col is a "dominant" beat
+is_beat = (cc % 3 == 0) | (rr % 4 == 0)
+
+xs = cc * (MODULE_SIZE + GUTTER)
+ys = rr * (MODULE_SIZE + GUTTER)
+
+base_h = rng.uniform(0.1, 0.5, size=(COLS, ROWS))
+beat_h = rng.uniform(2.0, 4.0, size=(COLS, ROWS))
+heights = np.where(is_beat, beat_h, base_h)
+
+# Color logic: Red for the beats, white for the texture
+red_mask = is_beat & (rng.random(size=(COLS, ROWS)) > 0.3)
+
+# Build all blocks into one mesh
+mesh = build_block_mesh("Grid", xs.ravel(), ys.ravel(), MODULE_SIZE, heights.ravel())
+mesh.materials.append(red_m)
+mesh.materials.append(white_m)
+# Slot 0 is red, slot 1 white
+mat_idx = np.where(red_mask.ravel(), 0, 1).astype(np.int32)
+mesh.polygons.foreach_set("material_index", np.repeat(mat_idx, len(BLOCK_FACES)))
+grid = bpy.data.objects.new("Grid", mesh)
+bpy.context.collection.objects.link(grid)
 
 # Ground
 bpy.ops.mesh.primitive_plane_add(size=100, location=(0,0,0))
@@ -56,7 +73,7 @@ ground.data.materials.append(white_m)
 bpy.ops.object.light_add(type='SUN', location=(10, -10, 20))
 sun = bpy.context.active_object
 sun.data.energy = 5
-sun.rotation_euler = (math.radians(45), 0, math.radians(45))
+sun.rotation_euler = (DEG45, 0, DEG45)
 
 # Camera: High-angle isometric-style perspective
 cam_pos = (COLS * 2, -COLS, COLS * 1.5)
@@ -67,11 +84,12 @@ cam.data.ortho_scale = COLS * 1.5
 # Look at center
 direction = Vector((COLS/2, ROWS/2, 0)) - Vector(cam_pos)
 # (Simplified rotation for now)
-cam.rotation_euler = (math.radians(55), 0, math.radians(45))
+cam.rotation_euler = (DEG55, 0, DEG45)
 
 # Render
 bpy.context.scene.camera = cam
 bpy.context.scene.render.filepath = "/data/.openclaw/workspace/art/renders/2026-02-15/vignelli_visual_score_01.png"
 bpy.context.scene.render.resolution_x = 1200
 bpy.context.scene.render.resolution_y = 1200
+configure_eevee(bpy.context.scene, samples=64)
 bpy.ops.render.render(write_still=True)
@@ -1,10 +1,19 @@
 import bpy
 import math
+import numpy as np
+import os
+import sys
 from mathutils import Vector
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scene_utils import (BLOCK_FACES, build_block_mesh, configure_eevee,
+                         principled_template, purge_scene)
+
+# Light and camera angles
+DEG35 = math.radians(35)
+DEG60 = math.radians(60)
+
+purge_scene()
 
 # VIGNELLI & FIBONACCI PARAMETERS
 COLS = 12
@@ -15,9 +24,11 @@ VIGNELLI_RED = (0.85, 0.1, 0.05, 1.0)
 BONE_WHITE = (0.95, 0.95, 0.9, 1.0)
 FIB = [1, 2, 3, 5, 8, 13]
 
+material_template = principled_template()
+
 def create_mat(name, color, roughness):
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
+    mat = material_template.copy()
+    mat.name = name
     bsdf = mat.node_tree.nodes.get("Principled BSDF")
     bsdf.inputs['Base Color'].default_value = color
     bsdf.inputs['Roughness'].default_value = roughness
@@ -27,28 +38,30 @@ def create_mat(name, color, roughness):
 red_m = create_mat("VignelliRed", VIGNELLI_RED, 0.05)      # Sharp, glossy, commanding
 white_m = create_mat("ArchitecturalWhite", BONE_WHITE, 0.4) # Matte, soft, textural
 
-# Generate Grid with Harmonic Logic
-for c in range(COLS):
-    for r in range(ROWS):
-        # The Logic: Rhythmic subdivision (3 and 4)
-        is_harmonic_x = (c % 3 == 0)
-        is_harmonic_y = (r % 4 == 0)
-        is_red = is_harmonic_x and is_harmonic_y # Strict intersection
-        
-        x = c * (MODULE_SIZE + GUTTER)
-        y = r * (MODULE_SIZE + GUTTER)
-        
-        # Fibonacci-based height progression: (c+r) index into sequence
-        # Scaled to keep architectural proportions
-        fib_index = (c + r) % len(FIB)
-        height = FIB[fib_index] * 0.25 if (is_harmonic_x or is_harmonic_y) else 0.1
-            
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, height/2))
-        block = bpy.context.active_object
-        block.scale = (MODULE_SIZE, MODULE_SIZE, height)
-        
-        # Color assignment: Pure system, zero randomness
-        block.data.materials.append(red_m if is_red else white_m)
+# Generate Grid with Harmonic Logic, built as a single mesh
+cc, rr = np.meshgrid(np.arange(COLS), np.arange(ROWS), indexing='ij')
+
+# The Logic: Rhythmic subdivision (3 and 4)
+is_harmonic_x = (cc % 3 == 0)
+is_harmonic_y = (rr % 4 == 0)
+red_mask = is_harmonic_x & is_harmonic_y # Strict intersection
+
+xs = cc * (MODULE_SIZE + GUTTER)
+ys = rr * (MODULE_SIZE + GUTTER)
+
+# Fibonacci-based height progression: (c+r) index into sequence
+# Scaled to keep architectural proportions
+fib = np.array(FIB)[(cc + rr) % len(FIB)]
+heights = np.where(is_harmonic_x | is_harmonic_y, fib * 0.25, 0.1)
+
+mesh = build_block_mesh("Grid", xs.ravel(), ys.ravel(), MODULE_SIZE, heights.ravel())
+mesh.materials.append(red_m)
+mesh.materials.append(white_m)
+# Color assignment: Pure system, zero randomness. Slot 0 is red, slot 1 white
+mat_idx = np.where(red_mask.ravel(), 0, 1).astype(np.int32)
+mesh.polygons.foreach_set("material_index", np.repeat(mat_idx, len(BLOCK_FACES)))
+grid = bpy.data.objects.new("Grid", mesh)
+bpy.context.collection.objects.link(grid)
 
 # Ground
 bpy.ops.mesh.primitive_plane_add(size=100, location=(0,0,0))
@@ -59,7 +72,7 @@ ground.data.materials.append(white_m)
 bpy.ops.object.light_add(type='SUN', location=(15, -10, 25))
 sun = bpy.context.active_object
 sun.data.energy = 6
-sun.rotation_euler = (math.radians(60), 0, math.radians(35)) # Deeper shadows
+sun.rotation_euler = (DEG60, 0, DEG35) # Deeper shadows
 
 # High-quality perspective
 cam_pos = (COLS * 2.5, -COLS * 1.5, COLS * 2)
@@ -76,6 +89,5 @@ scene.camera = cam
 scene.render.filepath = "/data/.openclaw/workspace/art/renders/2026-02-15/vignelli_visual_score_v2.png"
 scene.render.resolution_x = 1600
 scene.render.resolution_y = 1600
-scene.render.engine = 'CYCLES'
-scene.cycles.samples = 256 # Double the quality
+configure_eevee(scene, samples=64)
 bpy.ops.render.render(write_still=True)
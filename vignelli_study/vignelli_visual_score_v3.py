@@ -11,11 +11,20 @@ Key Changes:
 """
 import bpy
 import math
+import numpy as np
+import os
+import sys
 from mathutils import Vector
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scene_utils import (BLOCK_FACES, build_block_mesh, configure_eevee,
+                         principled_template, purge_scene)
+
+# Light and camera angles
+DEG35 = math.radians(35)
+DEG60 = math.radians(60)
+
+purge_scene()
 
 # Grid parameters
 COLS = 12
@@ -37,14 +46,36 @@ def color_from_temperature(t):
     color = cool.lerp(warm, t)
     return (*color, 1.0)
 
+# Principled BSDF wrapped once in a node group; materials only override its exposed inputs
+principled_group = bpy.data.node_groups.new("PrincipledGroup", 'ShaderNodeTree')
+principled_group.interface.new_socket("Base Color", in_out='INPUT', socket_type='NodeSocketColor')
+principled_group.interface.new_socket("Roughness", in_out='INPUT', socket_type='NodeSocketFloat')
+principled_group.interface.new_socket("Transmission", in_out='INPUT', socket_type='NodeSocketFloat')
+principled_group.interface.new_socket("BSDF", in_out='OUTPUT', socket_type='NodeSocketShader')
+group_in = principled_group.nodes.new('NodeGroupInput')
+group_out = principled_group.nodes.new('NodeGroupOutput')
+bsdf = principled_group.nodes.new('ShaderNodeBsdfPrincipled')
+bsdf.inputs['IOR'].default_value = 1.45
+for src, dst in (('Base Color', 'Base Color'), ('Roughness', 'Roughness'), ('Transmission', 'Transmission Weight')):
+    principled_group.links.new(group_in.outputs[src], bsdf.inputs[dst])
+principled_group.links.new(bsdf.outputs['BSDF'], group_out.inputs['BSDF'])
+
+# Template with its Principled BSDF swapped for the group node
+material_template = principled_template()
+template_nodes = material_template.node_tree.nodes
+template_nodes.remove(next(n for n in template_nodes if n.type == 'BSDF_PRINCIPLED'))
+group_node = template_nodes.new('ShaderNodeGroup')
+group_node.node_tree = principled_group
+material_output = next(n for n in template_nodes if n.type == 'OUTPUT_MATERIAL')
+material_template.node_tree.links.new(group_node.outputs['BSDF'], material_output.inputs['Surface'])
+
 def create_material(name, color, roughness, transmission=0.0):
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes.get("Principled BSDF")
-    bsdf.inputs['Base Color'].default_value = color
-    bsdf.inputs['Roughness'].default_value = roughness
-    bsdf.inputs['Transmission Weight'].default_value = transmission
-    bsdf.inputs['IOR'].default_value = 1.45
+    mat = material_template.copy()
+    mat.name = name
+    group = next(n for n in mat.node_tree.nodes if n.type == 'GROUP')
+    group.inputs['Base Color'].default_value = color
+    group.inputs['Roughness'].default_value = roughness
+    group.inputs['Transmission'].default_value = transmission
     return mat
 
 # Generate materials palette (7 temperature stops)
@@ -58,44 +89,32 @@ for i in range(7):
     mat = create_material(f"Temp_{i}", color, roughness, transmission)
     materials.append(mat)
 
-# Generate Grid
-center = Vector((COLS * (MODULE_SIZE + GUTTER) / 2, ROWS * (MODULE_SIZE + GUTTER) / 2))
-
-for c in range(COLS):
-    for r in range(ROWS):
-        x = c * (MODULE_SIZE + GUTTER)
-        y = r * (MODULE_SIZE + GUTTER)
-        pos = Vector((x, y))
-        
-        # Distance from center (normalized)
-        dist = (pos - center).length
-        max_dist = center.length
-        normalized_dist = dist / max_dist
-        
-        # Temperature: center=warm (1.0), edges=cool (0.0)
-        temperature = 1.0 - normalized_dist
-        
-        # Select material based on temperature
-        mat_index = int(temperature * 6)
-        mat_index = max(0, min(6, mat_index))
-        
-        # Fibonacci height (same as v2)
-        is_harmonic_x = (c % 3 == 0)
-        is_harmonic_y = (r % 4 == 0)
-        fib_index = (c + r) % len(FIB)
-        
-        if is_harmonic_x and is_harmonic_y:
-            height = FIB[fib_index] * 0.35  # Taller peaks
-        elif is_harmonic_x or is_harmonic_y:
-            height = FIB[fib_index] * 0.2
-        else:
-            height = 0.1
-        
-        # Create block
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, height/2))
-        block = bpy.context.active_object
-        block.scale = (MODULE_SIZE, MODULE_SIZE, height)
-        block.data.materials.append(materials[mat_index])
+# Generate Grid: per-cell temperature, material and height for the whole grid at once
+cc, rr = np.meshgrid(np.arange(COLS), np.arange(ROWS), indexing='ij')
+xs = cc * (MODULE_SIZE + GUTTER)
+ys = rr * (MODULE_SIZE + GUTTER)
+cx, cy = COLS * (MODULE_SIZE + GUTTER) / 2, ROWS * (MODULE_SIZE + GUTTER) / 2
+
+# Temperature: center=warm (1.0), edges=cool (0.0)
+temperature = 1.0 - np.hypot(xs - cx, ys - cy) / math.hypot(cx, cy)
+
+# Select material based on temperature
+mat_idx = np.clip((temperature * 6).astype(np.int32), 0, 6)
+
+# Fibonacci height (same as v2)
+is_harmonic_x = (cc % 3 == 0)
+is_harmonic_y = (rr % 4 == 0)
+fib = np.array(FIB)[(cc + rr) % len(FIB)]
+heights = np.where(is_harmonic_x & is_harmonic_y, fib * 0.35,  # Taller peaks
+                   np.where(is_harmonic_x | is_harmonic_y, fib * 0.2, 0.1))
+
+# Build all blocks into a single mesh with one material slot per temperature stop
+mesh = build_block_mesh("Grid", xs.ravel(), ys.ravel(), MODULE_SIZE, heights.ravel())
+for mat in materials:
+    mesh.materials.append(mat)
+mesh.polygons.foreach_set("material_index", np.repeat(mat_idx.ravel(), len(BLOCK_FACES)))
+grid = bpy.data.objects.new("Grid", mesh)
+bpy.context.collection.objects.link(grid)
 
 # Ground (neutral cool gray)
 bpy.ops.mesh.primitive_plane_add(size=100, location=(0, 0, 0))
@@ -108,7 +127,7 @@ bpy.ops.object.light_add(type='SUN', location=(15, -10, 25))
 sun = bpy.context.active_object
 sun.data.energy = 5.5
 sun.data.color = (1.0, 0.92, 0.8)  # Warm sunlight
-sun.rotation_euler = (math.radians(60), 0, math.radians(35))
+sun.rotation_euler = (DEG60, 0, DEG35)
 
 # Cool fill light
 bpy.ops.object.light_add(type='AREA', location=(-12, 12, 18))
@@ -130,9 +149,7 @@ scene.camera = cam
 scene.render.filepath = "/data/.openclaw/workspace/art/renders/2026-02-16/vignelli_visual_score_v3.png"
 scene.render.resolution_x = 1600
 scene.render.resolution_y = 1600
-scene.render.engine = 'CYCLES'
-scene.cycles.samples = 32
-scene.cycles.device = 'CPU'
+configure_eevee(scene, samples=64)
 
 print("🎨 Rendering Vignelli V3: Color as Data...")
 bpy.ops.render.render(write_still=True)
@@ -12,13 +12,24 @@ Key Evolution:
 Philosophy: The tension between design systems and living chaos
 """
 import bpy
+import bmesh
+import heapq
 import math
+import numpy as np
+import os
 import random
-from mathutils import Vector
+import sys
+from mathutils import Matrix
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scene_utils import configure_cycles, purge_scene
+
+# No undo steps while the scene is built
+edit_prefs = bpy.context.preferences.edit
+global_undo = edit_prefs.use_global_undo
+edit_prefs.use_global_undo = False
+
+purge_scene()
 
 # Grid parameters - tighter, more disciplined base
 COLS = 16
@@ -30,16 +41,19 @@ FIB = [1, 2, 3, 5, 8, 13, 21]
 # Seed for reproducible chaos
 random.seed(42)
 
+# State colors: cool gray-blue (system) and warm amber-orange (emergence)
+SYSTEM_COLOR = np.array((0.25, 0.28, 0.35))
+EMERGENT_COLOR = np.array((0.95, 0.55, 0.15))
+
 def color_from_state(state, intensity=1.0):
     """
-    state: 0.0 (system/total order) → 1.0 (emergence/chaos)
+    state: 0.0 (system/total order) → 1.0 (emergence/chaos), scalar or array
     Color shifts from cool gray-blue (system) to warm organic amber (life)
+    Returns one RGBA row per state
     """
-    system_color = Vector((0.25, 0.28, 0.35))  # Cool gray-blue
-    emergent_color = Vector((0.95, 0.55, 0.15))  # Warm amber-orange
-    
-    color = system_color.lerp(emergent_color, state * intensity)
-    return (*color, 1.0)
+    t = np.asarray(state, dtype=float)[..., None] * intensity
+    color = SYSTEM_COLOR + (EMERGENT_COLOR - SYSTEM_COLOR) * t
+    return np.concatenate((color, np.ones_like(t)), axis=-1)
 
 def create_material(name, color, roughness, metallic=0.0, emission=0.0):
     mat = bpy.data.materials.new(name=name)
@@ -57,42 +71,60 @@ def create_material(name, color, roughness, metallic=0.0, emission=0.0):
     return mat
 
 # Calculate emergence points (where chaos breaks through)
-emergence_centers = [
-    Vector((8, 6, 0)),
-    Vector((4, 12, 0)),
-    Vector((12, 10, 0)),
-]
+emergence_centers = np.array([
+    (8, 6),
+    (4, 12),
+    (12, 10),
+])
 
 def calculate_emergence(x, y):
-    """Calculate how much 'life' emerges at this grid point"""
-    pos = Vector((x, y, 0))
-    max_emergence = 0.0
-    
-    for center in emergence_centers:
-        dist = (pos - center).length
-        # Gaussian falloff of emergence influence
-        influence = math.exp(-(dist ** 2) / 8.0)
-        max_emergence = max(max_emergence, influence)
+    """Calculate how much 'life' emerges at each grid point (x, y: coordinate arrays)"""
+    # Gaussian falloff of emergence influence: it only decreases with distance,
+    # so the strongest center is always the nearest one
+    dist_sq = ((x[..., None] - emergence_centers[:, 0]) ** 2
+               + (y[..., None] - emergence_centers[:, 1]) ** 2).min(axis=-1)
+    max_emergence = np.exp(-dist_sq / 8.0)
     
     # Add subtle noise
-    noise = (math.sin(x * 0.7) + math.cos(y * 0.6)) * 0.05
-    return min(1.0, max(0.0, max_emergence + noise))
+    noise = (np.sin(x * 0.7) + np.cos(y * 0.6)) * 0.05
+    return np.clip(max_emergence + noise, 0.0, 1.0)
+
+# Emergence quantized into tiers; every block in a tier shares one material
+TIERS = 16
+mesh = bpy.data.meshes.new("Grid")
+tier_states = np.linspace(0.0, 1.0, TIERS)
+tier_colors = color_from_state(tier_states, intensity=1.2)  # Color lookup table, one row per tier
+for i, state in enumerate(tier_states):
+    # Material properties: emergent zones are glossier, more alive
+    roughness = 0.8 - (state * 0.6)  # 0.8 → 0.2
+    metallic = state * 0.3
+    emission = state * 0.4  # Slight glow for emergent areas
+    mesh.materials.append(create_material(f"Tier_{i}", tuple(tier_colors[i]), roughness, metallic, emission))
 
-# Generate Grid with emergence
+# Generate Grid with emergence, every block built into one bmesh
+# Strongest emergence points only: a min-heap capped at METABALL_LIMIT entries
+METABALL_LIMIT = 12
 objects_for_metaball = []
-center = Vector((COLS * (MODULE_SIZE + GUTTER) / 2, ROWS * (MODULE_SIZE + GUTTER) / 2))
+bm = bmesh.new()
+
+# Cell positions, computed once for every column and row
+pitch = MODULE_SIZE + GUTTER
+xs = np.arange(COLS) * pitch
+ys = np.arange(ROWS) * pitch
+
+# Emergence for the whole grid in one pass, indexed [col, row]
+grid_x, grid_y = np.meshgrid(xs, ys, indexing='ij')
+emergence_field = calculate_emergence(grid_x, grid_y)
 
 for c in range(COLS):
     for r in range(ROWS):
-        x = c * (MODULE_SIZE + GUTTER)
-        y = r * (MODULE_SIZE + GUTTER)
+        x = xs[c]
+        y = ys[r]
         
-        # Calculate emergence at this point
-        emergence = calculate_emergence(x, y)
+        # Emergence at this point
+        emergence = emergence_field[c, r]
         
         # Grid "importance" based on position
-        pos = Vector((x, y))
-        dist_from_center = (pos - center).length
         is_grid_line_x = (c % 4 == 0)
         is_grid_line_y = (r % 4 == 0)
         
@@ -108,25 +140,25 @@ for c in range(COLS):
             # Background grid
             height = 0.2 + (emergence * 0.5)
         
-        # Color based on emergence state
-        color = color_from_state(emergence, intensity=1.2)
-        
-        # Material properties: emergent zones are glossier, more alive
-        roughness = 0.8 - (emergence * 0.6)  # 0.8 → 0.2
-        metallic = emergence * 0.3
-        emission = emergence * 0.4  # Slight glow for emergent areas
+        # Color and material properties come from the emergence tier
+        tier = min(TIERS - 1, int(emergence * TIERS))
         
-        # Create block
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, height / 2))
-        block = bpy.context.active_object
-        block.scale = (MODULE_SIZE, MODULE_SIZE, height)
-        
-        mat = create_material(f"Block_{c}_{r}", color, roughness, metallic, emission)
-        block.data.materials.append(mat)
+        # Create block: unit cube scaled to the cell and stood on the ground
+        matrix = Matrix.Translation((x, y, height / 2)) @ Matrix.Diagonal((MODULE_SIZE, MODULE_SIZE, height, 1))
+        cube = bmesh.ops.create_cube(bm, size=1, matrix=matrix)
+        for face in {f for v in cube['verts'] for f in v.link_faces}:
+            face.material_index = tier
         
         # Track positions where emergence is strong for metaball creation
         if emergence > 0.7:
-            objects_for_metaball.append((x, y, height + 0.5, emergence))
+            heapq.heappush(objects_for_metaball, (emergence, x, y, height + 0.5))
+            if len(objects_for_metaball) > METABALL_LIMIT:
+                heapq.heappop(objects_for_metaball)  # Drop the weakest
+
+bm.to_mesh(mesh)
+bm.free()
+grid = bpy.data.objects.new("Grid", mesh)
+bpy.context.collection.objects.link(grid)
 
 # Create organic metaball emergence (the chaos breaking through)
 if objects_for_metaball:
@@ -165,7 +197,7 @@ if objects_for_metaball:
     meta_obj.data.materials.append(meta_mat)
     
     # Add metaball elements at emergence points
-    for x, y, z, strength in objects_for_metaball[:12]:  # Limit to strongest
+    for strength, x, y, z in sorted(objects_for_metaball, reverse=True):
         elem = meta_data.elements.new()
         elem.co = (x, y, z + random.uniform(0, 0.5))
         elem.radius = 0.4 + (strength * 0.6)
@@ -208,15 +240,32 @@ bpy.ops.object.camera_add(location=(cam_x, cam_y, 14))
 cam = bpy.context.active_object
 cam.rotation_euler = (math.radians(65), 0, math.radians(angle))
 
+# Scene is built: undo back on before rendering
+edit_prefs.use_global_undo = global_undo
+
 # Render
 scene = bpy.context.scene
 scene.camera = cam
 scene.render.filepath = "/data/.openclaw/workspace/art/renders/2026-02-17/vignelli_visual_score_v4.png"
 scene.render.resolution_x = 1800
 scene.render.resolution_y = 1800
-scene.render.engine = 'CYCLES'
-scene.cycles.samples = 48
-scene.cycles.device = 'CPU'
+configure_cycles(scene, samples=48)
+scene.cycles.adaptive_min_samples = 16
+scene.cycles.denoiser = 'OPENIMAGEDENOISE'
+scene.cycles.denoising_input_passes = 'RGB_ALBEDO_NORMAL'
+# Nothing here forms caustics; the metaball's subsurface and transmission keep a few extra bounces
+scene.cycles.max_bounces = 4
+scene.cycles.diffuse_bounces = 2
+scene.cycles.glossy_bounces = 2
+scene.cycles.transmission_bounces = 4
+scene.cycles.volume_bounces = 0
+scene.cycles.caustics_reflective = False
+scene.cycles.caustics_refractive = False
+scene.cycles.blur_glossy = 1.0
+scene.render.use_lock_interface = True  # No UI redraws against the scene while rendering
+# Fixed thread count, one core left for the system
+scene.render.threads_mode = 'FIXED'
+scene.render.threads = max(1, (os.cpu_count() or 1) - 1)
 
 print("🎨 Rendering Vignelli V4: Emergence...")
 print("   Theme: System vs Chaos - what escapes the grid?")
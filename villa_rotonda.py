@@ -11,12 +11,17 @@ Key Features:
 - Orthographic cameras for plan and section
 """
 import bpy
+import bmesh
 import math
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from mathutils import Vector
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scene_utils import (configure_cycles, configure_eevee, cube_template,
+                         cylinder_template, link_shape, purge_scene)
 
 # === PALLADIAN PROPORTIONS (based on research) ===
 MODULE = 2.0
@@ -34,6 +39,7 @@ PORTICO_WIDTH = MODULE * 8
 COLUMN_HEIGHT = MODULE * 3.2
 COLUMN_RADIUS = MODULE * 0.22
 INTERCOLUMNATION = MODULE * 1.8
+COLUMN_OFFSETS = [(i - 2.5) * INTERCOLUMNATION for i in range(6)]  # Six columns, centred on the portico
 
 CENTRAL_HALL_DIAMETER = MODULE * 6
 DOME_DRUM_HEIGHT = MODULE * 1.5
@@ -48,200 +54,290 @@ def create_material(name, color, roughness=0.5):
         bsdf.inputs['Roughness'].default_value = roughness
     return mat
 
-stone_base = create_material("StoneBase", (0.55, 0.52, 0.48), 0.9)
-stucco_wall = create_material("StuccoWall", (0.92, 0.90, 0.85), 0.4)
-marble_column = create_material("MarbleColumn", (0.95, 0.95, 0.93), 0.2)
-roof_tile = create_material("RoofTile", (0.42, 0.28, 0.18), 0.7)
-window_glass = create_material("WindowGlass", (0.15, 0.18, 0.22), 0.1)
-dome_lead = create_material("DomeLead", (0.35, 0.38, 0.42), 0.3)
-interior_wall = create_material("InteriorWall", (0.85, 0.82, 0.75), 0.5)
-
 # === FUNCTIONS ===
+# Shapes are objects sharing template meshes, built through bpy.data rather
+# than bpy.ops; the material is linked per object, so every column, step and
+# pediment reuses one mesh.
 def create_cube(name, size, location, material=None):
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
+    obj = link_shape(name, cube_template(), location, material=material)
     obj.scale = size
-    if material:
-        obj.data.materials.append(material)
     return obj
 
 def create_cylinder(name, radius, depth, location, vertices=32, material=None):
-    bpy.ops.mesh.primitive_cylinder_add(radius=radius, depth=depth, vertices=vertices, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
-    if material:
-        obj.data.materials.append(material)
+    return link_shape(name, cylinder_template(radius, depth, vertices), location, material=material)
+
+def create_dome(name, radius, subdivisions, location, material=None):
+    """Icosphere squashed to half height; even triangles instead of a UV sphere's crowded poles"""
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_icosphere(bm, subdivisions=subdivisions, radius=radius)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.materials.append(None)
+    obj = link_shape(name, mesh, location, material=material)
+    obj.scale.z = 0.5
     return obj
 
-def create_portico(direction_angle, name_suffix):
+def create_portico(direction_angle, name_suffix, stucco_wall, marble_column, stone_base):
     rad = math.radians(direction_angle)
+    sr, cr = math.sin(rad), math.cos(rad)
     offset = BUILDING_SIZE/2 + PORTICO_DEPTH/2
-    x = math.sin(rad) * offset
-    y = math.cos(rad) * offset
+    x = sr * offset
+    y = cr * offset
     
     # Pediment
-    portico_roof = create_cube(f"PorticoRoof_{name_suffix}", (PORTICO_WIDTH/2, PORTICO_DEPTH/2, 0.3), (x, y, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + 0.5), stucco_wall)
+    create_cube(f"PorticoRoof_{name_suffix}", (PORTICO_WIDTH/2, PORTICO_DEPTH/2, 0.3), (x, y, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + 0.5), stucco_wall)
     
     # Six columns
-    for i in range(6):
-        col_x_offset = (i - 2.5) * INTERCOLUMNATION
+    for i, col_x_offset in enumerate(COLUMN_OFFSETS):
         if direction_angle in [0, 180]:
             col_x = x + col_x_offset
             col_y = y
         else:
             col_x = x
             col_y = y + col_x_offset
-        col = create_cylinder(f"Column_{name_suffix}_{i}", COLUMN_RADIUS, COLUMN_HEIGHT, (col_x, col_y, BASEMENT_HEIGHT + COLUMN_HEIGHT/2), 16, marble_column)
+        create_cylinder(f"Column_{name_suffix}_{i}", COLUMN_RADIUS, COLUMN_HEIGHT, (col_x, col_y, BASEMENT_HEIGHT + COLUMN_HEIGHT/2), 16, marble_column)
     
     # Stairs
     stair_width = PORTICO_WIDTH * 0.7
     stair_depth = PORTICO_DEPTH * 0.4
     num_steps = 7
+    step_height = BASEMENT_HEIGHT / num_steps
     for i in range(num_steps):
-        step_height = BASEMENT_HEIGHT / num_steps
         step_z = (i + 0.5) * step_height
         step_offset = (i + 0.5) * (stair_depth / num_steps)
-        step_x = x + math.sin(rad) * step_offset
-        step_y = y + math.cos(rad) * step_offset
-        step = create_cube(f"Stairs_{name_suffix}_{i}", (stair_width/2, stair_depth/num_steps/2, step_height/2), (step_x, step_y, step_z), stone_base)
+        step_x = x + sr * step_offset
+        step_y = y + cr * step_offset
+        create_cube(f"Stairs_{name_suffix}_{i}", (stair_width/2, stair_depth/num_steps/2, step_height/2), (step_x, step_y, step_z), stone_base)
 
 # === BUILD ===
-print("Building Villa Rotonda...")
-
-# Basement
-basement = create_cube("Basement", (BUILDING_SIZE/2 + 0.2, BUILDING_SIZE/2 + 0.2, BASEMENT_HEIGHT/2), (0, 0, BASEMENT_HEIGHT/2), stone_base)
-
-# Piano nobile
-main_body = create_cube("MainBody", (BUILDING_SIZE/2 - 0.1, BUILDING_SIZE/2 - 0.1, PIANO_NOBILE_HEIGHT/2), (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2), stucco_wall)
-
-# Four porticos
-print("  Creating four porticos...")
-for angle, suffix in [(0, "N"), (90, "E"), (180, "S"), (270, "W")]:
-    create_portico(angle, suffix)
-
-# Attic
-attic = create_cube("Attic", (BUILDING_SIZE/2 - 0.3, BUILDING_SIZE/2 - 0.3, ATTIC_HEIGHT/2), (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT/2), stucco_wall)
-
-# Dome drum
-drum = create_cylinder("DomeDrum", CENTRAL_HALL_DIAMETER/2 + 0.3, DOME_DRUM_HEIGHT, (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + DOME_DRUM_HEIGHT/2), 48, stucco_wall)
-
-# Dome
-bpy.ops.mesh.primitive_uv_sphere_add(radius=CENTRAL_HALL_DIAMETER/2 + 0.3, segments=48, ring_count=24, location=(0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + DOME_DRUM_HEIGHT))
-dome = bpy.context.active_object
-dome.name = "Dome"
-dome.scale.z = 0.5
-dome.data.materials.append(dome_lead)
-
-# Lantern
-lantern_base = BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + DOME_DRUM_HEIGHT + CENTRAL_HALL_DIAMETER/4
-bpy.ops.mesh.primitive_cylinder_add(radius=CENTRAL_HALL_DIAMETER/10, depth=MODULE, vertices=16, location=(0, 0, lantern_base + MODULE/2))
-lantern = bpy.context.active_object
-lantern.name = "Lantern"
-lantern.data.materials.append(stucco_wall)
-
-bpy.ops.mesh.primitive_uv_sphere_add(radius=CENTRAL_HALL_DIAMETER/8, segments=24, ring_count=12, location=(0, 0, lantern_base + MODULE))
-lantern_dome = bpy.context.active_object
-lantern_dome.name = "LanternDome"
-lantern_dome.scale.z = 0.5
-lantern_dome.data.materials.append(dome_lead)
-
-# Roof
-roof = create_cube("MainRoof", (BUILDING_SIZE/2 + 0.5, BUILDING_SIZE/2 + 0.5, MODULE), (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + MODULE/2 - 0.3), roof_tile)
-
-# Windows
-win_width = MODULE * 0.6
-win_height = MODULE * 1.8
-win_z = BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT * 0.6
-positions = [(0, -BUILDING_SIZE/2 + 0.2), (0, BUILDING_SIZE/2 - 0.2), (BUILDING_SIZE/2 - 0.2, 0), (-BUILDING_SIZE/2 + 0.2, 0), (BUILDING_SIZE/4, -BUILDING_SIZE/2 + 0.2), (-BUILDING_SIZE/4, -BUILDING_SIZE/2 + 0.2), (BUILDING_SIZE/4, BUILDING_SIZE/2 - 0.2), (-BUILDING_SIZE/4, BUILDING_SIZE/2 - 0.2)]
-for i, (x, y) in enumerate(positions):
-    create_cube(f"Window_{i}", (win_width/2, 0.1, win_height/2), (x, y, win_z), window_glass)
-
-# Interior hall
-hall_lower = create_cylinder("HallLower", CENTRAL_HALL_DIAMETER/2 - 0.5, PIANO_NOBILE_HEIGHT * 0.6, (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT * 0.3), 48, interior_wall)
-
-# Lighting
-bpy.ops.object.light_add(type='SUN', location=(25, -25, 35))
-sun = bpy.context.active_object
-sun.data.energy = 4.0
-sun.data.color = (1.0, 0.92, 0.82)
-sun.rotation_euler = (math.radians(55), 0, math.radians(45))
-
-bpy.ops.object.light_add(type='AREA', location=(-20, 15, 20))
-fill = bpy.context.active_object
-fill.data.energy = 1.5
-fill.data.color = (0.75, 0.8, 0.9)
-fill.data.size = 15.0
-
-# === CAMERAS ===
-print("Creating cameras...")
-
-# Perspective
-cam_dist = BUILDING_SIZE * 2.5
-bpy.ops.object.camera_add(location=(cam_dist * 0.7, -cam_dist * 0.7, BUILDING_SIZE * 0.8))
-persp_cam = bpy.context.active_object
-persp_cam.name = "PerspectiveCamera"
-direction = Vector((0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2)) - persp_cam.location
-persp_cam.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
-
-# Plan (ortho top)
-bpy.ops.object.camera_add(location=(0, 0, BUILDING_SIZE * 2))
-plan_cam = bpy.context.active_object
-plan_cam.name = "PlanCamera"
-plan_cam.data.type = 'ORTHO'
-plan_cam.data.ortho_scale = BUILDING_SIZE * 2.5
-plan_cam.rotation_euler = (0, 0, 0)
-
-# Section (ortho cut through)
-bpy.ops.object.camera_add(location=(BUILDING_SIZE * 2, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2))
-section_cam = bpy.context.active_object
-section_cam.name = "SectionCamera"
-section_cam.data.type = 'ORTHO'
-section_cam.data.ortho_scale = BUILDING_SIZE * 1.8
-section_cam.rotation_euler = (math.radians(90), 0, math.radians(90))
-
-# Elevation (ortho front)
-bpy.ops.object.camera_add(location=(0, -BUILDING_SIZE * 2, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2))
-front_cam = bpy.context.active_object
-front_cam.name = "FrontElevationCamera"
-front_cam.data.type = 'ORTHO'
-front_cam.data.ortho_scale = BUILDING_SIZE * 1.5
-front_cam.rotation_euler = (math.radians(90), 0, 0)
-
-# Render
+def build_scene():
+    """Villa, lights and the four view cameras in the current scene"""
+    purge_scene()
+
+    stone_base = create_material("StoneBase", (0.55, 0.52, 0.48), 0.9)
+    stucco_wall = create_material("StuccoWall", (0.92, 0.90, 0.85), 0.4)
+    marble_column = create_material("MarbleColumn", (0.95, 0.95, 0.93), 0.2)
+    roof_tile = create_material("RoofTile", (0.42, 0.28, 0.18), 0.7)
+    window_glass = create_material("WindowGlass", (0.15, 0.18, 0.22), 0.1)
+    dome_lead = create_material("DomeLead", (0.35, 0.38, 0.42), 0.3)
+    interior_wall = create_material("InteriorWall", (0.85, 0.82, 0.75), 0.5)
+
+    print("Building Villa Rotonda...")
+
+    # Basement
+    create_cube("Basement", (BUILDING_SIZE/2 + 0.2, BUILDING_SIZE/2 + 0.2, BASEMENT_HEIGHT/2), (0, 0, BASEMENT_HEIGHT/2), stone_base)
+
+    # Piano nobile
+    create_cube("MainBody", (BUILDING_SIZE/2 - 0.1, BUILDING_SIZE/2 - 0.1, PIANO_NOBILE_HEIGHT/2), (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2), stucco_wall)
+
+    # Four porticos
+    print("  Creating four porticos...")
+    for angle, suffix in [(0, "N"), (90, "E"), (180, "S"), (270, "W")]:
+        create_portico(angle, suffix, stucco_wall, marble_column, stone_base)
+
+    # Attic
+    create_cube("Attic", (BUILDING_SIZE/2 - 0.3, BUILDING_SIZE/2 - 0.3, ATTIC_HEIGHT/2), (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT/2), stucco_wall)
+
+    # Dome drum
+    create_cylinder("DomeDrum", CENTRAL_HALL_DIAMETER/2 + 0.3, DOME_DRUM_HEIGHT, (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + DOME_DRUM_HEIGHT/2), 48, stucco_wall)
+
+    # Dome
+    create_dome("Dome", CENTRAL_HALL_DIAMETER/2 + 0.3, 4, (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + DOME_DRUM_HEIGHT), dome_lead)
+
+    # Lantern
+    lantern_base = BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + DOME_DRUM_HEIGHT + CENTRAL_HALL_DIAMETER/4
+    create_cylinder("Lantern", CENTRAL_HALL_DIAMETER/10, MODULE, (0, 0, lantern_base + MODULE/2), 16, stucco_wall)
+
+    create_dome("LanternDome", CENTRAL_HALL_DIAMETER/8, 2, (0, 0, lantern_base + MODULE), dome_lead)
+
+    # Roof
+    create_cube("MainRoof", (BUILDING_SIZE/2 + 0.5, BUILDING_SIZE/2 + 0.5, MODULE), (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT + ATTIC_HEIGHT + MODULE/2 - 0.3), roof_tile)
+
+    # Windows
+    win_width = MODULE * 0.6
+    win_height = MODULE * 1.8
+    win_z = BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT * 0.6
+    positions = [(0, -BUILDING_SIZE/2 + 0.2), (0, BUILDING_SIZE/2 - 0.2), (BUILDING_SIZE/2 - 0.2, 0), (-BUILDING_SIZE/2 + 0.2, 0), (BUILDING_SIZE/4, -BUILDING_SIZE/2 + 0.2), (-BUILDING_SIZE/4, -BUILDING_SIZE/2 + 0.2), (BUILDING_SIZE/4, BUILDING_SIZE/2 - 0.2), (-BUILDING_SIZE/4, BUILDING_SIZE/2 - 0.2)]
+    for i, (x, y) in enumerate(positions):
+        create_cube(f"Window_{i}", (win_width/2, 0.1, win_height/2), (x, y, win_z), window_glass)
+
+    # Interior hall
+    create_cylinder("HallLower", CENTRAL_HALL_DIAMETER/2 - 0.5, PIANO_NOBILE_HEIGHT * 0.6, (0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT * 0.3), 48, interior_wall)
+
+    # Lighting
+    bpy.ops.object.light_add(type='SUN', location=(25, -25, 35))
+    sun = bpy.context.active_object
+    sun.data.energy = 4.0
+    sun.data.color = (1.0, 0.92, 0.82)
+    sun.rotation_euler = (math.radians(55), 0, math.radians(45))
+
+    bpy.ops.object.light_add(type='AREA', location=(-20, 15, 20))
+    fill = bpy.context.active_object
+    fill.data.energy = 1.5
+    fill.data.color = (0.75, 0.8, 0.9)
+    fill.data.size = 15.0
+
+    # Cameras
+    print("Creating cameras...")
+
+    # Perspective
+    cam_dist = BUILDING_SIZE * 2.5
+    bpy.ops.object.camera_add(location=(cam_dist * 0.7, -cam_dist * 0.7, BUILDING_SIZE * 0.8))
+    persp_cam = bpy.context.active_object
+    persp_cam.name = "PerspectiveCamera"
+    direction = Vector((0, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2)) - persp_cam.location
+    persp_cam.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+
+    # Plan (ortho top)
+    bpy.ops.object.camera_add(location=(0, 0, BUILDING_SIZE * 2))
+    plan_cam = bpy.context.active_object
+    plan_cam.name = "PlanCamera"
+    plan_cam.data.type = 'ORTHO'
+    plan_cam.data.ortho_scale = BUILDING_SIZE * 2.5
+    plan_cam.rotation_euler = (0, 0, 0)
+
+    # Section (ortho cut through)
+    bpy.ops.object.camera_add(location=(BUILDING_SIZE * 2, 0, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2))
+    section_cam = bpy.context.active_object
+    section_cam.name = "SectionCamera"
+    section_cam.data.type = 'ORTHO'
+    section_cam.data.ortho_scale = BUILDING_SIZE * 1.8
+    section_cam.rotation_euler = (math.radians(90), 0, math.radians(90))
+
+    # Elevation (ortho front)
+    bpy.ops.object.camera_add(location=(0, -BUILDING_SIZE * 2, BASEMENT_HEIGHT + PIANO_NOBILE_HEIGHT/2))
+    front_cam = bpy.context.active_object
+    front_cam.name = "FrontElevationCamera"
+    front_cam.data.type = 'ORTHO'
+    front_cam.data.ortho_scale = BUILDING_SIZE * 1.5
+    front_cam.rotation_euler = (math.radians(90), 0, 0)
+
+# === RENDER ===
+OUTPUT_DIR = '/data/.openclaw/workspace/art'
+BLEND_PATH = os.path.join(OUTPUT_DIR, 'villa_rotonda.blend')
+
+# Per-view output, engine, resolution and hidden objects, keyed by camera name.
+# Cycles for the perspective; the orthographic drawings rasterize with EEVEE at a
+# smaller square size. The interior hall is buried in the main body, so only the
+# section shows it, with the body cut away.
+VIEWS = {
+    "PerspectiveCamera": {
+        "label": "perspective", "engine": 'CYCLES', "resolution": (1600, 1200), "hidden": ("HallLower",),
+        "filepath": os.path.join(OUTPUT_DIR, 'villa_rotonda_perspective.png'),
+    },
+    "PlanCamera": {
+        "label": "plan", "engine": 'EEVEE', "resolution": (1024, 1024), "hidden": ("HallLower",),
+        "filepath": os.path.join(OUTPUT_DIR, 'villa_rotonda_plan.png'),
+    },
+    "SectionCamera": {
+        "label": "section", "engine": 'EEVEE', "resolution": (1024, 1024), "hidden": ("MainBody",),
+        "filepath": os.path.join(OUTPUT_DIR, 'villa_rotonda_section.png'),
+    },
+    "FrontElevationCamera": {
+        "label": "elevation", "engine": 'EEVEE', "resolution": (1024, 1024), "hidden": ("HallLower",),
+        "filepath": os.path.join(OUTPUT_DIR, 'villa_rotonda_elevation.png'),
+    },
+}
+VIEW_TOGGLED = {name for view in VIEWS.values() for name in view["hidden"]}
+
+def render_threads(budget, workers):
+    """Threads per Blender instance: the thread budget, less one for the system, split between workers"""
+    return max(1, (budget - 1) // workers)
+
+def configure_render(scene, threads):
+    """Cycles settings shared by every view; render_view picks the engine and resolution"""
+    scene.render.threads_mode = 'FIXED'
+    scene.render.threads = threads
+    configure_cycles(scene, samples=192)
+    scene.cycles.adaptive_min_samples = 16
+    scene.cycles.denoiser = 'OPENIMAGEDENOISE'
+    scene.cycles.denoising_input_passes = 'RGB_ALBEDO_NORMAL'
+    # Opaque stone and stucco, no caustics: a few bounces carry nearly all of the light
+    scene.cycles.max_bounces = 4
+    scene.cycles.diffuse_bounces = 2
+    scene.cycles.glossy_bounces = 2
+    scene.cycles.transmission_bounces = 2
+    scene.cycles.volume_bounces = 0
+    scene.cycles.caustics_reflective = False
+    scene.cycles.caustics_refractive = False
+    scene.cycles.blur_glossy = 1.0
+    scene.render.use_lock_interface = True  # No UI redraws against the scene while rendering
+    # Spatial splits: slower BVH build, tighter BVH for the many overlapping boxes
+    scene.cycles.debug_use_spatial_splits = True
+
+def render_view(scene, camera_name):
+    view = VIEWS[camera_name]
+    if view["engine"] == 'EEVEE':
+        configure_eevee(scene, samples=64)
+    else:
+        scene.render.engine = 'CYCLES'  # Device and sampling already set by configure_render
+    for name in VIEW_TOGGLED:
+        bpy.data.objects[name].hide_render = name in view["hidden"]
+    scene.render.resolution_x, scene.render.resolution_y = view["resolution"]
+    scene.camera = bpy.data.objects[camera_name]
+    scene.render.filepath = view["filepath"]
+    print(f"Rendering {view['label']} view...")
+    bpy.ops.render.render(write_still=True)
+
+def render_workers(workers, threads):
+    """Render each view in its own background Blender loaded from the saved .blend; returns the failed cameras"""
+    def run(camera_name):
+        # --python-exit-code: a worker whose script raises exits non-zero instead of 0
+        cmd = [bpy.app.binary_path, '-b', BLEND_PATH, '-t', str(threads), '--python-exit-code', '1',
+               '--python', os.path.abspath(__file__), '--', '--camera', camera_name]
+        return camera_name, subprocess.run(cmd).returncode
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for camera_name, code in pool.map(run, VIEWS):
+            if code != 0:
+                failed.append(camera_name)
+                print(f"❌ {camera_name} worker failed (exit {code})")
+    return failed
+
+def parse_args(budget):
+    """Options after Blender's '--': --camera NAME renders one view, --workers N sets the render fan-out"""
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    camera, workers = None, min(len(VIEWS), max(1, budget // 4))
+    for flag, value in zip(argv[::2], argv[1::2]):
+        if flag == '--camera':
+            camera = value
+        elif flag == '--workers':
+            workers = max(1, int(value))
+    return camera, workers
+
 scene = bpy.context.scene
-scene.render.engine = 'CYCLES'
-scene.cycles.device = 'CPU'
-scene.cycles.samples = 192
-scene.render.resolution_x = 1600
-scene.render.resolution_y = 1200
-
-# Render Perspective
-scene.camera = persp_cam
-scene.render.filepath = '/data/.openclaw/workspace/art/villa_rotonda_perspective.png'
-print("Rendering perspective view...")
-bpy.ops.render.render(write_still=True)
-
-# Render Plan
-scene.camera = plan_cam
-scene.render.filepath = '/data/.openclaw/workspace/art/villa_rotonda_plan.png'
-print("Rendering plan view...")
-bpy.ops.render.render(write_still=True)
-
-# Render Section
-scene.camera = section_cam
-scene.render.filepath = '/data/.openclaw/workspace/art/villa_rotonda_section.png'
-print("Rendering section view...")
-bpy.ops.render.render(write_still=True)
-
-# Render Elevation
-scene.camera = front_cam
-scene.render.filepath = '/data/.openclaw/workspace/art/villa_rotonda_elevation.png'
-print("Rendering elevation view...")
-bpy.ops.render.render(write_still=True)
-
-print("\n✅ Villa Rotonda complete!")
-print("   - Perspective: 3/4 view")
-print("   - Plan: Orthographic top view")
-print("   - Section: Orthographic cut-through")
-print("   - Elevation: Orthographic front facade")
+# Effective thread count: honours -t from render_all.py or the parent villa run
+budget = scene.render.threads
+camera, workers = parse_args(budget)
+
+if camera:
+    # Worker: the saved .blend is already loaded, render just this view on the threads it was given
+    configure_render(scene, budget)
+    render_view(scene, camera)
+else:
+    # No undo steps while the scene is built
+    edit_prefs = bpy.context.preferences.edit
+    global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    build_scene()
+    edit_prefs.use_global_undo = global_undo
+    threads = render_threads(budget, workers)
+    configure_render(scene, threads)
+    if workers == 1:
+        # Single worker (e.g. one GPU): render every view in this process
+        for camera_name in VIEWS:
+            render_view(scene, camera_name)
+    else:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=BLEND_PATH)
+        failed = render_workers(workers, threads)
+        if failed:
+            sys.exit(1)
+
+    print("\n✅ Villa Rotonda complete!")
+    print("   - Perspective: 3/4 view")
+    print("   - Plan: Orthographic top view")
+    print("   - Section: Orthographic cut-through")
+    print("   - Elevation: Orthographic front facade")